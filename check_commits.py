@@ -2,23 +2,37 @@
 # SPDX-License-Identifier: BSD-3-Clause-Clear
 
 import os
+import re
 import sys
 import requests
 import argparse
 
 api_base_url = os.getenv("GITHUB_API_URL")
 
+# Maximum page size accepted by the GitHub REST API.
+COMMITS_PER_PAGE = 100
+
+# One session for every API call so the per-commit comment and status
+# requests reuse a single kept-alive connection instead of opening a new
+# TLS connection each time.
+session = requests.Session()
+
+SIGNED_OFF_RE = re.compile(r"signed-off-by", re.IGNORECASE)
+
+
+# Built once at import so repeated parse_arguments() calls only parse.
+parser = argparse.ArgumentParser(description="Validate commit messages in a GitHub PR.")
+parser.add_argument("--repo", required=True)
+parser.add_argument("--pr-number", required=True)
+parser.add_argument("--body-limit", type=int, default=72)
+parser.add_argument("--sub-limit", type=int, default=50)
+parser.add_argument("--check-blank-line", type=str, default="true")
+
 
 def parse_arguments():
-    parser = argparse.ArgumentParser(
-        description="Validate commit messages in a GitHub PR."
-    )
-    parser.add_argument("--repo", required=True)
-    parser.add_argument("--pr-number", required=True)
-    parser.add_argument("--body-limit", type=int, default=72)
-    parser.add_argument("--sub-limit", type=int, default=50)
-    parser.add_argument("--check-blank-line", type=str, default="true")
-    return parser.parse_args()
+    args = parser.parse_args()
+    args.check_blank_line = args.check_blank_line.lower() == "true"
+    return args
 
 
 def fetch_commits(args):
@@ -27,48 +41,76 @@ def fetch_commits(args):
         print("::error::No GITHUB_TOKEN found!")
         sys.exit(1)
 
+    # Outside pull_request events the PR number expands to an empty string;
+    # stop here instead of requesting a URL that can only 404.
+    if not args.pr_number.strip():
+        print("::error::No pull request number given!")
+        sys.exit(1)
+
     url = f"{api_base_url}/repos/{args.repo}/pulls/{args.pr_number}/commits"
     headers = {
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github.v3+json",
     }
-    response = requests.get(url, headers=headers)
 
-    if response.status_code != 200:
-        print(
-            f"::error::Failed to fetch PR commits: {response.status_code} {response.text}"
+    # Request the largest page the API allows so a PR is listed in as few
+    # round trips as possible; a short page means there is nothing left.
+    # Every page is fetched before returning so a failed request exits
+    # before any commit has been commented on or given a status.
+    commits = []
+    page = 1
+    while True:
+        response = session.get(
+            url, headers=headers, params={"per_page": COMMITS_PER_PAGE, "page": page}
         )
-        sys.exit(1)
 
-    return response.json()
+        if response.status_code != 200:
+            print(
+                f"::error::Failed to fetch PR commits: {response.status_code} {response.text}"
+            )
+            sys.exit(1)
+
+        batch = response.json()
+        commits.extend(batch)
+        if len(batch) < COMMITS_PER_PAGE:
+            return commits
+        page += 1
 
 
 def validate_commit_message(commit, sub_char_limit, body_char_limit, check_blank_line):
     sha = commit["sha"]
     message = commit["commit"]["message"]
-    lines = message.splitlines()
-    n = len(lines)
-
-    subject = lines[0] if n >= 1 else ""
-    body = [
-        line.strip()
-        for line in lines[1:]
-        if line.strip() and not line.lower().startswith("signed-off-by")
-    ]
-    signed_off = lines[-1] if "signed-off-by" in lines[-1].lower() else ""
+    # Walk the lines once, remembering only the last two for the
+    # Signed-off-by checks. The blank separator line after the subject is
+    # dropped by the body filter, so every line after the subject is fed
+    # through it.
+    subject = ""
     missing_sub_body_line = False
-    missing_body_sign_line = False
-
-    if check_blank_line.lower() == "true":
-        if n > 1 and lines[1].strip() != "":
+    prev_line = ""
+    last_line = ""
+    body = []
+    for i, line in enumerate(message.splitlines()):
+        prev_line, last_line = last_line, line
+        if i == 0:
+            subject = line
+            continue
+        stripped = line.strip()
+        if i == 1 and check_blank_line and stripped:
             missing_sub_body_line = True
-        else:
-            body = [
-                line.strip()
-                for line in lines[2:]
-                if line.strip() and not line.lower().startswith("signed-off-by")
-            ]
-        if signed_off and lines[-2].strip() != "":
+        if not stripped:
+            continue
+        if SIGNED_OFF_RE.match(stripped):
+            continue
+        # Keep the line as written so its length includes any indentation
+        # or trailing whitespace.
+        body.append(line)
+
+    # The trailer is only needed for the blank-line check.
+    signed_off = ""
+    missing_body_sign_line = False
+    if check_blank_line:
+        signed_off = last_line if SIGNED_OFF_RE.search(last_line) else ""
+        if signed_off and prev_line.strip() != "":
             missing_body_sign_line = True
 
     errors = []
@@ -76,16 +118,15 @@ def validate_commit_message(commit, sub_char_limit, body_char_limit, check_blank
         errors.append("Commit message is missing subject!")
     if len(subject) > sub_char_limit:
         errors.append(f"Subject exceeds {sub_char_limit} characters!")
-    if check_blank_line.lower() == "true":
+    if check_blank_line:
         if missing_sub_body_line and subject and body:
             errors.append("Subject and body must be separated by a blank line")
         if missing_body_sign_line and body and signed_off:
             errors.append("Body and Signed-off-by must be separated by a blank line")
     if len(body) == 0:
         errors.append("Commit message is missing a body!")
-    for line in body:
-        if len(line) > body_char_limit:
-            errors.append(f"Line exceeds {body_char_limit} characters: {line}")
+    line_error = f"Line exceeds {body_char_limit} characters: "
+    errors.extend(line_error + line for line in body if len(line) > body_char_limit)
 
     return sha, errors
 
@@ -99,7 +140,7 @@ def add_commit_comment(repo, sha, message):
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github.v3+json",
     }
-    requests.post(url, headers=headers, json={"body": message})
+    session.post(url, headers=headers, json={"body": message})
 
 
 def set_commit_status(repo, sha, state, description):
@@ -116,23 +157,35 @@ def set_commit_status(repo, sha, state, description):
         "description": description,
         "context": "commit-message-check",
     }
-    requests.post(url, headers=headers, json=data)
+    session.post(url, headers=headers, json=data)
 
 
 def process_commits(commits, repo, sub_limit, body_limit, check_blank_line):
     failed_count = 0
+    # Validation depends only on the message, so backports and other
+    # commits that repeat a message reuse the first result. The keys are
+    # the message strings already held in commits, so the cache keeps no
+    # extra copies of them.
+    errors_by_message = {}
     for commit in commits:
-        sha, errors = validate_commit_message(
-            commit, sub_limit, body_limit, check_blank_line
-        )
+        sha = commit["sha"]
+        message = commit["commit"]["message"]
+        errors = errors_by_message.get(message)
+        if errors is None:
+            _, errors = validate_commit_message(
+                commit, sub_limit, body_limit, check_blank_line
+            )
+            errors_by_message[message] = errors
         if errors:
-            print(f"::group:: ❌ Errors in commit {sha}")
             failed_count += 1
-            for err in errors:
-                print(f"::error:: {err}")
+            # Emit the whole group with one write rather than a print() per
+            # error line.
+            parts = [f"::group:: ❌ Errors in commit {sha}"]
+            parts.extend(f"::error:: {err}" for err in errors)
+            parts.append("::endgroup::")
+            sys.stdout.write("\n".join(parts) + "\n")
             add_commit_comment(repo, sha, "\n".join(errors))
             set_commit_status(repo, sha, "failure", "Commit message validation failed")
-            print("::endgroup::")
         else:
             print(f"✅ Commit {sha} passed all checks.")
             set_commit_status(repo, sha, "success", "Commit message validation passed")
@@ -148,12 +201,13 @@ def main():
 
     summary_path = os.getenv("GITHUB_STEP_SUMMARY")
     if summary_path:
+        summary = "### Commit Validation Summary\n"
+        if failed_count:
+            summary += f"- ❌ {failed_count} commit(s) failed validation.\n"
+        else:
+            summary += "- ✅ All commits passed validation.\n"
         with open(summary_path, "a") as f:
-            f.write("### Commit Validation Summary\n")
-            if failed_count:
-                f.write(f"- ❌ {failed_count} commit(s) failed validation.\n")
-            else:
-                f.write("- ✅ All commits passed validation.\n")
+            f.write(summary)
 
     sys.exit(1 if failed_count else 0)
 
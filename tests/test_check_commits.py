@@ -26,25 +26,24 @@ class TestCheckCommits(unittest.TestCase):
             }
         }
 
-    @patch('check_commits.parse_arguments')
-    def test_parse_arguments(self, mock_parse_args):
-        mock_args = MagicMock()
-        mock_args.repo = "test/repo"
-        mock_args.pr_number = "123"
-        mock_args.body_limit = 72
-        mock_args.sub_limit = 50
-        mock_args.check_blank_line = "true"
-        mock_parse_args.return_value = mock_args
-
-        args = check_commits.parse_arguments()
+    def test_parse_arguments(self):
+        base_argv = ["check_commits.py", "--repo", "test/repo", "--pr-number", "123"]
+        with patch('sys.argv', base_argv):
+            args = check_commits.parse_arguments()
 
         self.assertEqual(args.repo, "test/repo")
         self.assertEqual(args.pr_number, "123")
         self.assertEqual(args.body_limit, 72)
         self.assertEqual(args.sub_limit, 50)
-        self.assertEqual(args.check_blank_line, "true")
+        self.assertIs(args.check_blank_line, True)
+
+        for value, expected in (("true", True), ("True", True), ("false", False)):
+            with self.subTest(value=value):
+                with patch('sys.argv', base_argv + ["--check-blank-line", value]):
+                    args = check_commits.parse_arguments()
+                self.assertIs(args.check_blank_line, expected)
 
-    @patch('check_commits.requests.get')
+    @patch('check_commits.session.get')
     @patch('os.getenv')
     def test_fetch_commits_success(self, mock_getenv, mock_get):
         mock_getenv.return_value = "fake_token"
@@ -62,9 +61,66 @@ class TestCheckCommits(unittest.TestCase):
         self.assertEqual(result, [self.sample_commit])
         mock_get.assert_called_once()
 
+    @patch('check_commits.session.get')
+    @patch('os.getenv')
+    def test_fetch_commits_paginates(self, mock_getenv, mock_get):
+        mock_getenv.return_value = "fake_token"
+        full_page = MagicMock(status_code=200)
+        full_page.json.return_value = [self.sample_commit] * check_commits.COMMITS_PER_PAGE
+        last_page = MagicMock(status_code=200)
+        last_page.json.return_value = [self.sample_commit]
+        mock_get.side_effect = [full_page, last_page]
+
+        args = MagicMock()
+        args.repo = "test/repo"
+        args.pr_number = "123"
+
+        result = check_commits.fetch_commits(args)
+
+        self.assertEqual(len(result), check_commits.COMMITS_PER_PAGE + 1)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('check_commits.session.get')
+    @patch('os.getenv')
+    def test_fetch_commits_missing_pr_number(self, mock_getenv, mock_get):
+        mock_getenv.return_value = "fake_token"
+        args = MagicMock()
+        args.repo = "test/repo"
+        args.pr_number = ""
+
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            with self.assertRaises(SystemExit) as cm:
+                check_commits.fetch_commits(args)
+
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("No pull request number given!", mock_stdout.getvalue())
+        mock_get.assert_not_called()
+
+    @patch('check_commits.process_commits')
+    @patch('check_commits.parse_arguments')
+    @patch('check_commits.session.get')
+    @patch('os.getenv')
+    def test_main_later_page_failure_reports_nothing(
+        self, mock_getenv, mock_get, mock_parse_args, mock_process
+    ):
+        mock_getenv.return_value = "fake_token"
+        full_page = MagicMock(status_code=200)
+        full_page.json.return_value = [self.sample_commit] * check_commits.COMMITS_PER_PAGE
+        failed_page = MagicMock(status_code=502, text="Bad Gateway")
+        mock_get.side_effect = [full_page, failed_page]
+        mock_parse_args.return_value = MagicMock(repo="test/repo", pr_number="123")
+
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            with self.assertRaises(SystemExit) as cm:
+                check_commits.main()
+
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("Failed to fetch PR commits: 502", mock_stdout.getvalue())
+        mock_process.assert_not_called()
+
     def test_validate_commit_message_valid(self):
         sha, errors = check_commits.validate_commit_message(
-            self.sample_commit, 50, 72, check_blank_line="true"
+            self.sample_commit, 50, 72, check_blank_line=True
         )
         self.assertEqual(sha, "abc123")
         self.assertEqual(errors, [])
@@ -73,11 +129,36 @@ class TestCheckCommits(unittest.TestCase):
     def test_process_commits_all_valid(self, mock_stdout):
         commits = [self.sample_commit]
         failed_count = check_commits.process_commits(
-            commits, self.repo, 50, 72, check_blank_line="true"
+            commits, self.repo, 50, 72, check_blank_line=True
         )
         self.assertEqual(failed_count, 0)
         self.assertIn("✅ Commit abc123 passed all checks", mock_stdout.getvalue())
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_process_commits_failure_output(self, mock_stdout):
+        commit = {"sha": "bad123", "commit": {"message": "Subject only"}}
+        failed_count = check_commits.process_commits(
+            [commit], self.repo, 50, 72, check_blank_line=True
+        )
+        self.assertEqual(failed_count, 1)
+        self.assertEqual(
+            mock_stdout.getvalue(),
+            "::group:: ❌ Errors in commit bad123\n"
+            "::error:: Commit message is missing a body!\n"
+            "::endgroup::\n",
+        )
+
+    @patch('check_commits.validate_commit_message', wraps=check_commits.validate_commit_message)
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_process_commits_reuses_duplicate_messages(self, mock_stdout, mock_validate):
+        duplicate = dict(self.sample_commit, sha="abc456")
+        failed_count = check_commits.process_commits(
+            [self.sample_commit, duplicate], self.repo, 50, 72, check_blank_line=True
+        )
+        self.assertEqual(failed_count, 0)
+        self.assertEqual(mock_validate.call_count, 1)
+        self.assertIn("✅ Commit abc456 passed all checks", mock_stdout.getvalue())
+
     def test_validate_commit_message_subject_too_long(self):
         commit = {
             "sha": "def456",
@@ -89,7 +170,7 @@ class TestCheckCommits(unittest.TestCase):
                 )
             }
         }
-        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line="false") # check_blank_line is set to false
+        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line=False) # check_blank_line is set to false
         self.assertIn("Subject exceeds 50 characters!", errors)
         self.assertIsNot("Subject and description must be separated by a blank line",errors)
     
@@ -104,10 +185,34 @@ class TestCheckCommits(unittest.TestCase):
                 )
             }
         }
-        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line="true") # check_blank_line is set to true
+        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line=True) # check_blank_line is set to true
         self.assertIn("Subject exceeds 50 characters!", errors)
         self.assertIn("Subject and body must be separated by a blank line",errors)
 
 
+    def test_validate_commit_message_empty(self):
+        commit = {"sha": "ghi789", "commit": {"message": ""}}
+        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line=True)
+        self.assertIn("Commit message is missing subject!", errors)
+        self.assertIn("Commit message is missing a body!", errors)
+
+    def test_validate_commit_message_body_limit_counts_whitespace(self):
+        commit = {
+            "sha": "jkl012",
+            "commit": {"message": "Valid subject\n\n" + "x" * 70 + "   "},
+        }
+        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line=True)
+        self.assertEqual(errors, ["Line exceeds 72 characters: " + "x" * 70 + "   "])
+
+    def test_validate_commit_message_indented_signed_off_is_not_body(self):
+        commit = {
+            "sha": "mno345",
+            "commit": {
+                "message": "Valid subject\n\n  Signed-off-by: Developer <dev@example.com>"
+            },
+        }
+        sha, errors = check_commits.validate_commit_message(commit, 50, 72, check_blank_line=True)
+        self.assertEqual(errors, ["Commit message is missing a body!"])
+
 if __name__ == "__main__":
     unittest.main()